@@ -4,6 +4,8 @@ in flexible ways to build complex dashboards.
 """
 from __future__ import absolute_import, division, unicode_literals
 
+import sys
+
 from collections import OrderedDict
 
 import param
@@ -15,7 +17,24 @@ from bokeh.models import (Column as BkColumn, Row as BkRow,
 from bokeh.models.widgets import Tabs as BkTabs, Panel as BkPanel
 
 from .util import param_name, param_reprs
-from .viewable import Reactive
+from .viewable import Reactive, Viewable
+
+# Dictionaries preserve insertion order in Python 3.6+
+if sys.version_info >= (3, 6):
+    _ordered_dict = dict
+else:
+    _ordered_dict = OrderedDict
+
+
+def _panel(obj, **kwargs):
+    """
+    Coerces an object to a Viewable, only importing and dispatching
+    to the pane machinery if the object is not already a Viewable.
+    """
+    if isinstance(obj, Viewable):
+        return obj
+    from .pane import panel
+    return panel(obj, **kwargs)
 
 
 class Panel(Reactive):
@@ -57,10 +76,26 @@ class Panel(Reactive):
     # Callback API
     #----------------------------------------------------------------
 
+    def _objects_changed(self, old):
+        """
+        Whether the objects differ from the supplied old objects.
+        Objects which were modified in place and then triggered are
+        always considered to have changed.
+        """
+        new = self.objects
+        return (old is new or len(old) != len(new) or
+                any(o is not n for o, n in zip(old, new)))
+
     def _update_model(self, events, msg, root, model, doc, comm=None):
-        if self._rename['objects'] in msg:
+        children = self._rename['objects']
+        if children in msg:
             old = events['objects'].old
-            msg[self._rename['objects']] = self._get_objects(model, old, doc, root, comm)
+            if self._objects_changed(old):
+                msg[children] = self._get_objects(model, old, doc, root, comm)
+            else:
+                msg = {k: v for k, v in msg.items() if k != children}
+                if not msg:
+                    return
         model.update(**msg)
 
         from .io import state
@@ -83,36 +118,57 @@ class Panel(Reactive):
         Returns new child models for the layout while reusing unchanged
         models and cleaning up any dropped objects.
         """
-        from .pane import panel
-        new_models = []
+        root_id = root.ref['id']
+        old_ids = {id(obj) for obj in old_objects}
+        new_models = [None]*len(self.objects)
+        any_new = False
         for i, pane in enumerate(self.objects):
-            pane = panel(pane)
-            self.objects[i] = pane
-            if pane in old_objects:
-                child, _ = pane._models[root.ref['id']]
+            pane = _panel(pane)
+            if self.objects[i] is not pane:
+                self.objects[i] = pane
+            if id(pane) in old_ids:
+                child, _ = pane._models[root_id]
             else:
                 child = pane._get_model(doc, root, model, comm)
-            new_models.append(child)
+                any_new = True
+            new_models[i] = child
+        new_ids = {id(obj) for obj in self.objects}
         for obj in old_objects:
-            if obj not in self.objects:
+            if id(obj) not in new_ids:
                 obj._cleanup(root)
+
+        # Return the existing children if all child models were reused
+        # in the same order
+        old_models = getattr(model, self._rename['objects'], None)
+        if (not any_new and old_models is not None and
+            len(new_models) == len(old_models) and
+            all(new is old for new, old in zip(new_models, old_models))):
+            return old_models
         return new_models
 
     def _get_model(self, doc, root=None, parent=None, comm=None):
         model = self._bokeh_model()
         if root is None:
             root = model
-        objects = self._get_objects(model, [], doc, root, comm)
-        props = dict(self._init_properties(), objects=objects)
-        model.update(**self._process_param_change(props))
+        props = self._init_properties()
+        props[self._rename['objects']] = self._get_objects(model, [], doc, root, comm)
+        model.update(**props)
         self._models[root.ref['id']] = (model, parent)
         self._link_props(model, self._linked_props, doc, root, comm)
         return model
 
     def _cleanup(self, root):
-        super(Panel, self)._cleanup(root)
-        for p in self.objects:
-            p._cleanup(root)
+        # Traverse nested layouts iteratively rather than recursively,
+        # deferring to any layouts which override the cleanup
+        stack = [self]
+        while stack:
+            layout = stack.pop()
+            super(Panel, layout)._cleanup(root)
+            for obj in layout:
+                if isinstance(obj, Panel) and type(obj)._cleanup == Panel._cleanup:
+                    stack.append(obj)
+                else:
+                    obj._cleanup(root)
 
     #----------------------------------------------------------------
     # Public API
@@ -156,15 +212,24 @@ class ListPanel(Panel):
     __abstract = True
 
     def __init__(self, *objects, **params):
-        from .pane import panel
         if objects:
             if 'objects' in params:
                 raise ValueError("A %s's objects should be supplied either "
                                  "as positional arguments or as a keyword, "
                                  "not both." % type(self).__name__)
-            params['objects'] = [panel(pane) for pane in objects]
+            params['objects'] = [_panel(pane) for pane in objects]
         super(Panel, self).__init__(**params)
 
+    def _object_index(self, obj):
+        """
+        Returns the index of the first object in the layout which is
+        identical to the supplied object or None.
+        """
+        for i, o in enumerate(self.objects):
+            if o is obj:
+                return i
+        return None
+
     #----------------------------------------------------------------
     # Public API
     #----------------------------------------------------------------
@@ -176,46 +241,43 @@ class ListPanel(Panel):
         return len(self.objects)
 
     def __iter__(self):
-        for obj in self.objects:
-            yield obj
+        return iter(self.objects)
 
     def __contains__(self, obj):
-        return obj in self.objects
+        return self._object_index(obj) is not None
 
     def __setitem__(self, index, panes):
-        from .pane import panel
-        new_objects = list(self)
+        nobjs = len(self.objects)
+        new_objects = self.objects[:]
         if not isinstance(index, slice):
             start, end = index, index+1
-            if start > len(self.objects):
+            if start > nobjs:
                 raise IndexError('Index %d out of bounds on %s '
                                  'containing %d objects.' %
-                                 (end, type(self).__name__, len(self.objects)))
+                                 (end, type(self).__name__, nobjs))
             panes = [panes]
         else:
-            start = index.start or 0
-            end = len(self) if index.stop is None else index.stop
             if index.start is None and index.stop is None:
                 if not isinstance(panes, list):
                     raise IndexError('Expected a list of objects to '
                                      'replace the objects in the %s, '
                                      'got a %s type.' %
                                      (type(self).__name__, type(panes).__name__))
-                expected = len(panes)
-                new_objects = [None]*expected
-                end = expected
-            elif end > len(self.objects):
+                start, end = 0, len(panes)
+                new_objects = [None]*end
+            elif index.stop is not None and index.stop > nobjs:
                 raise IndexError('Index %d out of bounds on %s '
                                  'containing %d objects.' %
-                                 (end, type(self).__name__, len(self.objects)))
+                                 (index.stop, type(self).__name__, nobjs))
             else:
-                expected = end-start
+                start, end, _ = index.indices(nobjs)
+            expected = end-start
             if not isinstance(panes, list) or len(panes) != expected:
                 raise IndexError('Expected a list of %d objects to set '
                                  'on the %s to match the supplied slice.' %
                                  (expected, type(self).__name__))
         for i, pane in zip(range(start, end), panes):
-            new_objects[i] = panel(pane)
+            new_objects[i] = _panel(pane)
         self.objects = new_objects
 
     def clone(self, *objects, **params):
@@ -252,9 +314,8 @@ class ListPanel(Panel):
         ---------
         obj (object): Panel component to add to the layout.
         """
-        from .pane import panel
-        new_objects = list(self)
-        new_objects.append(panel(obj))
+        new_objects = self.objects[:]
+        new_objects.append(_panel(obj))
         self.objects = new_objects
 
     def clear(self):
@@ -271,9 +332,8 @@ class ListPanel(Panel):
         ---------
         objects (list): List of panel components to add to the layout.
         """
-        from .pane import panel
-        new_objects = list(self)
-        new_objects.extend(list(map(panel, objects)))
+        new_objects = self.objects[:]
+        new_objects.extend(list(map(_panel, objects)))
         self.objects = new_objects
 
     def insert(self, index, obj):
@@ -285,9 +345,8 @@ class ListPanel(Panel):
         index (int): Index at which to insert the object.
         object (object): Panel components to insert in the layout.
         """
-        from .pane import panel
-        new_objects = list(self)
-        new_objects.insert(index, panel(obj))
+        new_objects = self.objects[:]
+        new_objects.insert(index, _panel(obj))
         self.objects = new_objects
 
     def pop(self, index):
@@ -298,9 +357,9 @@ class ListPanel(Panel):
         ---------
         index (int): The index of the item to pop from the layout.
         """
-        new_objects = list(self)
-        if index in new_objects:
-            index = new_objects.index(index)
+        if not isinstance(index, int):
+            index = self._object_index(index)
+        new_objects = self.objects[:]
         obj = new_objects.pop(index)
         self.objects = new_objects
         return obj
@@ -313,15 +372,18 @@ class ListPanel(Panel):
         ---------
         obj (object): The object to remove from the layout.
         """
-        new_objects = list(self)
-        new_objects.remove(obj)
+        index = self._object_index(obj)
+        if index is None:
+            raise ValueError('%s not in %s.' % (obj, type(self).__name__))
+        new_objects = self.objects[:]
+        new_objects.pop(index)
         self.objects = new_objects
 
     def reverse(self):
         """
         Reverses the objects in the layout.
         """
-        new_objects = list(self)
+        new_objects = self.objects[:]
         new_objects.reverse()
         self.objects = new_objects
 
@@ -399,39 +461,44 @@ class Tabs(ListPanel):
         self._param_watchers['objects']['value'].reverse()
 
     def _to_object_and_name(self, item):
-        from .pane import panel
         if isinstance(item, tuple):
             name, item = item
         else:
             name = getattr(item, 'name', None)
-        pane = panel(item, name=name)
+        pane = _panel(item, name=name)
         name = param_name(pane.name) if name is None else name
         return pane, name
 
     def _to_objects_and_names(self, items):
-        objects, names = [], []
-        for item in items:
-            pane, name = self._to_object_and_name(item)
-            objects.append(pane)
-            names.append(name)
-        return objects, names
+        pairs = [self._to_object_and_name(item) for item in items]
+        if not pairs:
+            return [], []
+        objects, names = zip(*pairs)
+        return list(objects), list(names)
 
     def _init_properties(self):
-        return {k: v for k, v in self.param.get_param_values()
-                if v is not None and k != 'closable'}
+        properties = {k: v for k, v in self.param.get_param_values()
+                      if v is not None and k not in ('closable', 'objects')}
+        return self._process_param_change(properties)
 
     #----------------------------------------------------------------
     # Callback API
     #----------------------------------------------------------------
 
+    def _objects_changed(self, old):
+        # Tab names may change without the objects changing
+        return True
+
     def _update_names(self, event):
         if len(event.new) == len(self._names):
             return
+        old_index = {}
+        for i, obj in enumerate(event.old):
+            old_index.setdefault(id(obj), i)
         names = []
         for obj in event.new:
-            if obj in event.old:
-                index = event.old.index(obj)
-                name = self._names[index]
+            if id(obj) in old_index:
+                name = self._names[old_index[id(obj)]]
             else:
                 name = obj.name
             names.append(name)
@@ -453,25 +520,28 @@ class Tabs(ListPanel):
         Returns new child models for the layout while reusing unchanged
         models and cleaning up any dropped objects.
         """
-        from .pane import panel
-        new_models = []
+        new_models = [None]*len(self.objects)
         if len(self._names) != len(self):
             raise ValueError('Tab names do not match objects, ensure '
                              'that the Tabs.objects are not modified '
                              'directly. Found %d names, expected %d.' %
                              (len(self._names), len(self)))
+        root_id = root.ref['id']
+        old_ids = {id(obj) for obj in old_objects}
         for i, (name, pane) in enumerate(zip(self._names, self)):
-            pane = panel(pane, name=name)
-            self.objects[i] = pane
-            if pane in old_objects:
-                child, _ = pane._models[root.ref['id']]
+            pane = _panel(pane, name=name)
+            if self.objects[i] is not pane:
+                self.objects[i] = pane
+            if id(pane) in old_ids:
+                child, _ = pane._models[root_id]
             else:
                 child = pane._get_model(doc, root, model, comm)
             child = BkPanel(title=name, name=pane.name, child=child,
                             closable=self.closable)
-            new_models.append(child)
+            new_models[i] = child
+        new_ids = {id(obj) for obj in self.objects}
         for obj in old_objects:
-            if obj not in self.objects:
+            if id(obj) not in new_ids:
                 obj._cleanup(root)
         return new_models
 
@@ -480,33 +550,32 @@ class Tabs(ListPanel):
     #----------------------------------------------------------------
 
     def __setitem__(self, index, panes):
-        new_objects = list(self)
+        nobjs = len(self.objects)
+        new_objects = self.objects[:]
         if not isinstance(index, slice):
-            if index > len(self.objects):
+            if index > nobjs:
                 raise IndexError('Index %d out of bounds on %s '
                                  'containing %d objects.' %
-                                 (index, type(self).__name__, len(self.objects)))
+                                 (index, type(self).__name__, nobjs))
             start, end = index, index+1
             panes = [panes]
         else:
-            start = index.start or 0
-            end = len(self.objects) if index.stop is None else index.stop
             if index.start is None and index.stop is None:
                 if not isinstance(panes, list):
                     raise IndexError('Expected a list of objects to '
                                      'replace the objects in the %s, '
                                      'got a %s type.' %
                                      (type(self).__name__, type(panes).__name__))
-                expected = len(panes)
-                new_objects = [None]*expected
-                self._names = [None]*len(panes)
-                end = expected
+                start, end = 0, len(panes)
+                new_objects = [None]*end
+                self._names = [None]*end
+            elif index.stop is not None and index.stop > nobjs:
+                raise IndexError('Index %d out of bounds on %s '
+                                 'containing %d objects.' %
+                                 (index.stop, type(self).__name__, nobjs))
             else:
-                expected = end-start
-                if end > len(self.objects):
-                    raise IndexError('Index %d out of bounds on %s '
-                                     'containing %d objects.' %
-                                     (end, type(self).__name__, len(self.objects)))
+                start, end, _ = index.indices(nobjs)
+            expected = end-start
             if not isinstance(panes, list) or len(panes) != expected:
                 raise IndexError('Expected a list of %d objects to set '
                                  'on the %s to match the supplied slice.' %
@@ -550,7 +619,7 @@ class Tabs(ListPanel):
         obj (object): Panel component to add as a tab.
         """
         new_object, new_name = self._to_object_and_name(pane)
-        new_objects = list(self)
+        new_objects = self.objects[:]
         new_objects.append(new_object)
         self._names.append(new_name)
         self.objects = new_objects
@@ -571,7 +640,7 @@ class Tabs(ListPanel):
         objects (list): List of panel components to add as tabs.
         """
         new_objects, new_names = self._to_objects_and_names(panes)
-        objects = list(self)
+        objects = self.objects[:]
         objects.extend(new_objects)
         self._names.extend(new_names)
         self.objects = objects
@@ -586,7 +655,7 @@ class Tabs(ListPanel):
         object (object): Panel components to insert as tabs.
         """
         new_object, new_name = self._to_object_and_name(pane)
-        new_objects = list(self.objects)
+        new_objects = self.objects[:]
         new_objects.insert(index, new_object)
         self._names.insert(index, new_name)
         self.objects = new_objects
@@ -599,9 +668,9 @@ class Tabs(ListPanel):
         ---------
         index (int): The index of the item to pop from the tabs.
         """
-        new_objects = list(self)
-        if index in new_objects:
-            index = new_objects.index(index)
+        if not isinstance(index, int):
+            index = self._object_index(index)
+        new_objects = self.objects[:]
         new_objects.pop(index)
         self._names.pop(index)
         self.objects = new_objects
@@ -614,10 +683,11 @@ class Tabs(ListPanel):
         ---------
         obj (object): The object to remove from the tabs.
         """
-        new_objects = list(self)
-        if pane in new_objects:
-            index = new_objects.index(pane)
-        new_objects.remove(pane)
+        index = self._object_index(pane)
+        if index is None:
+            raise ValueError('%s not in %s.' % (pane, type(self).__name__))
+        new_objects = self.objects[:]
+        new_objects.pop(index)
         self._names.pop(index)
         self.objects = new_objects
 
@@ -625,7 +695,7 @@ class Tabs(ListPanel):
         """
         Reverses the tabs.
         """
-        new_objects = list(self)
+        new_objects = self.objects[:]
         new_objects.reverse()
         self._names.reverse()
         self.objects = new_objects
@@ -651,8 +721,14 @@ class GridSpec(Panel):
 
     def __init__(self, **params):
         if 'objects' not in params:
-            params['objects'] = OrderedDict()
+            params['objects'] = _ordered_dict()
         super(GridSpec, self).__init__(**params)
+        self._geom_cache = None
+        self.param.watch(self._invalidate_geom, 'objects')
+        # ALERT: Ensure that the geometry is invalidated before the
+        #        model is updated, should be replaced by watch
+        #        precedence support in param
+        self._param_watchers['objects']['value'].reverse()
 
     def _init_properties(self):
         properties = super(GridSpec, self)._init_properties()
@@ -663,6 +739,12 @@ class GridSpec(Panel):
                 properties['min_height'] = properties['height']
         return properties
 
+    def _objects_changed(self, old):
+        new = self.objects
+        return (old is new or len(old) != len(new) or
+                any(ok != nk or ov is not nv for (ok, ov), (nk, nv)
+                    in zip(old.items(), new.items())))
+
     def _get_objects(self, model, old_objects, doc, root, comm=None):
         if self.ncols:
             width = int(float(self.width)/self.ncols)
@@ -706,36 +788,108 @@ class GridSpec(Panel):
                 model.update(**properties)
             children.append((model, r, c, h, w))
 
-        new_objects = list(self.objects.values())
+        new_ids = {id(obj) for obj in self.objects.values()}
         if isinstance(old_objects, dict):
             old_objects = list(old_objects.values())
         for old in old_objects:
-            if old not in new_objects:
+            if id(old) not in new_ids:
                 old._cleanup(root)
         return children
 
+    def _invalidate_geom(self, event=None):
+        self._geom_cache = None
+
+    def _compute_geom(self):
+        """
+        Computes the number of rows and columns and the x- and
+        y-offsets of the grid in a single pass over the objects and
+        caches them until the objects are changed.
+        """
+        min_yidx, min_xidx, max_yidx, max_xidx = [], [], [], []
+        for (y0, x0, y1, x1) in self.objects:
+            if y0 is not None: min_yidx.append(y0)
+            if x0 is not None: min_xidx.append(x0)
+            if y1 is not None: max_yidx.append(y1)
+            if x1 is not None: max_xidx.append(x1)
+        nobjs = len(self.objects)
+        nrows = max(max_yidx) if max_yidx else 0
+        ncols = max(max_xidx) if max_xidx else 0
+        xoff = min(min_xidx) if min_xidx and len(min_xidx) == nobjs else 0
+        yoff = min(min_yidx) if min_yidx and len(min_yidx) == nobjs else 0
+        self._geom_cache = (nrows, ncols, xoff, yoff)
+        return self._geom_cache
+
     @property
     def _xoffset(self):
-        min_xidx = [x0 for (_, x0, _, _) in self.objects if x0 is not None]
-        return min(min_xidx) if min_xidx and len(min_xidx) == len(self.objects) else 0
+        return (self._geom_cache or self._compute_geom())[2]
 
     @property
     def _yoffset(self):
-        min_yidx = [y0 for (y0, x0, _, _) in self.objects if y0 is not None]
-        return min(min_yidx) if min_yidx and len(min_yidx) == len(self.objects) else 0
+        return (self._geom_cache or self._compute_geom())[3]
 
-    @property
-    def _object_grid(self):
-        grid = np.full((self.nrows, self.ncols), None)
-        for i, ((y0, x0, y1, x1), obj) in enumerate(self.objects.items()):
-            l = 0 if x0 is None else x0
-            r = self.ncols if x1 is None else x1
+    @staticmethod
+    def _index_range(idx, size):
+        """
+        Converts an integer or slice index along an axis of the given
+        size into a (start, stop) range and whether it was a scalar.
+        A stop of None denotes a range without an upper bound.
+        """
+        if isinstance(idx, slice):
+            if idx.step not in (None, 1):
+                raise IndexError('GridSpec does not support indexing '
+                                 'with a slice step, got %s.' % idx.step)
+            start, stop = idx.start, idx.stop
+            start = 0 if start is None else start
+            if start < 0:
+                start = max(start+size, 0)
+            if stop is not None and stop < 0:
+                stop += size
+            return start, stop, False
+        if not -size <= idx < size:
+            raise IndexError('Index %d is out of bounds for GridSpec '
+                             'axis with size %d.' % (idx, size))
+        if idx < 0:
+            idx += size
+        return idx, idx+1, True
+
+    def _intersecting(self, ys, ye, xs, xe):
+        """
+        Returns a list of (cell, key, object) tuples for the objects
+        intersecting the supplied row and column ranges, sorted by the
+        first cell each object occupies within the region. Objects and
+        ranges without an upper bound extend indefinitely along that
+        axis.
+        """
+        if (ye is not None and ys >= ye) or (xe is not None and xs >= xe):
+            return []
+        hits = []
+        for key, obj in self.objects.items():
+            y0, x0, y1, x1 = key
             t = 0 if y0 is None else y0
-            b = self.nrows if y1 is None else y1
-            for y in range(t, b):
-                for x in range(l, r):
-                    grid[y, x] = {((y0, x0, y1, x1), obj)}
-        return grid
+            l = 0 if x0 is None else x0
+            if ((ye is not None and t >= ye) or (xe is not None and l >= xe) or
+                (y1 is not None and y1 <= ys) or (x1 is not None and x1 <= xs)):
+                continue
+            hits.append(((max(t, ys), max(l, xs)), key, obj))
+        hits.sort(key=lambda hit: hit[0])
+        return hits
+
+    def _objects_in_region(self, index):
+        """
+        Returns the objects intersecting the region selected by the
+        supplied index, ordered by the first cell they occupy in that
+        region, and whether the index selects a single cell.
+        """
+        if isinstance(index, tuple):
+            yidx, xidx = index
+        else:
+            yidx, xidx = index, slice(None)
+
+        ys, ye, yscalar = self._index_range(yidx, self.nrows)
+        xs, xe, xscalar = self._index_range(xidx, self.ncols)
+        hits = self._intersecting(ys, ye, xs, xe)
+        objects = _ordered_dict([(key, obj) for _, key, obj in hits])
+        return objects, yscalar and xscalar
 
     #----------------------------------------------------------------
     # Public API
@@ -743,24 +897,34 @@ class GridSpec(Panel):
 
     @property
     def nrows(self):
-        max_yidx = [y1 for (_, _, y1, _) in self.objects if y1 is not None]
-        return max(max_yidx) if max_yidx else 0
+        return (self._geom_cache or self._compute_geom())[0]
 
     @property
     def ncols(self):
-        max_xidx = [x1 for (_, _, _, x1) in self.objects if x1 is not None]
-        return max(max_xidx) if max_xidx else 0
+        return (self._geom_cache or self._compute_geom())[1]
 
     @property
     def grid(self):
-        grid = np.zeros((self.nrows, self.ncols), dtype='uint8')
-        for (y0, x0, y1, x1) in self.objects:
-            x0 = 0 if x0 is None else x0
-            x1 = self.ncols if x1 is None else x1
-            y0 = 0 if y0 is None else y0
-            y1 = self.nrows if y1 is None else y1
-            grid[y0:y1, x0:x1] += 1
-        return grid
+        nrows, ncols = self.nrows, self.ncols
+        extents = np.array([
+            (0 if y0 is None else y0, 0 if x0 is None else x0,
+             nrows if y1 is None else y1, ncols if x1 is None else x1)
+            for (y0, x0, y1, x1) in self.objects], dtype='int32').reshape(-1, 4)
+        # Clip the extents to the grid and drop empty regions, which
+        # would otherwise scatter out of bounds or negative counts
+        extents[:, 0::2] = np.clip(extents[:, 0::2], 0, nrows)
+        extents[:, 1::2] = np.clip(extents[:, 1::2], 0, ncols)
+        extents = extents[(extents[:, 0] < extents[:, 2]) &
+                          (extents[:, 1] < extents[:, 3])]
+        y0s, x0s, y1s, x1s = extents.T
+        # Scatter the corners of each object into a delta array, the
+        # 2D cumulative sum of which counts the objects in each cell
+        delta = np.zeros((nrows+1, ncols+1), dtype='int32')
+        np.add.at(delta, (y0s, x0s), 1)
+        np.add.at(delta, (y0s, x1s), -1)
+        np.add.at(delta, (y1s, x0s), -1)
+        np.add.at(delta, (y1s, x1s), 1)
+        return delta.cumsum(0).cumsum(1)[:-1, :-1].astype('uint8')
 
     def clone(self, **params):
         """
@@ -778,36 +942,27 @@ class GridSpec(Panel):
         return type(self)(**p)
 
     def __iter__(self):
-        for obj in self.objects.values():
-            yield obj
+        return iter(self.objects.values())
 
     def __delitem__(self, index, trigger=True):
-        if isinstance(index, tuple):
-            yidx, xidx = index
-        else:
-            yidx, xidx = index, slice(None)
-
-        subgrid = self._object_grid[yidx, xidx]
-        if isinstance(subgrid, np.ndarray):
-            deleted = OrderedDict([list(o)[0] for o in subgrid.flatten()])
-        else:
-            deleted = [list(subgrid)[0][0]]
+        deleted, _ = self._objects_in_region(index)
         if deleted:
             for key in deleted:
                 del self.objects[key]
+            self._invalidate_geom()
             if trigger:
                 self.param.trigger('objects')
 
     def __getitem__(self, index):
-        if isinstance(index, tuple):
-            yidx, xidx = index
+        objects, scalar = self._objects_in_region(index)
+        if scalar:
+            if not objects:
+                raise IndexError('No object found at index %s on %s.'
+                                 % (index, type(self).__name__))
+            return list(objects.values())[0]
         else:
-            yidx, xidx = index, slice(None)
-
-        subgrid = self._object_grid[yidx, xidx]
-        if isinstance(subgrid, np.ndarray):
             params = dict(self.get_param_values())
-            params['objects'] = OrderedDict([list(o)[0] for o in subgrid.flatten()])
+            params['objects'] = objects
             gspec = GridSpec(**params)
             xoff, yoff = gspec._xoffset, gspec._yoffset
             adjusted = []
@@ -816,9 +971,8 @@ class GridSpec(Panel):
                 if y1 is not None: y1 -= yoff
                 if x0 is not None: x0 -= xoff
                 if x1 is not None: x1 -= xoff
-                if ((y0, x0, y1, x1), obj) not in adjusted:
-                    adjusted.append(((y0, x0, y1, x1), obj))
-            gspec.objects = OrderedDict(adjusted)
+                adjusted.append(((y0, x0, y1, x1), obj))
+            gspec.objects = _ordered_dict(adjusted)
             width_scale = gspec.ncols/float(self.ncols)
             height_scale = gspec.nrows/float(self.nrows)
             if gspec.width:
@@ -830,8 +984,6 @@ class GridSpec(Panel):
             if gspec.max_height:
                 gspec.max_height = int(gspec.max_height * height_scale)
             return gspec
-        else:
-            return list(subgrid)[0][1]
 
     def __setitem__(self, index, obj):
         from .pane.base import Pane
@@ -849,30 +1001,25 @@ class GridSpec(Panel):
         else:
             y0, y1 = (yidx, yidx+1)
 
-        l = 0 if x0 is None else x0
-        r = self.nrows if x1 is None else x1
-        t = 0 if y0 is None else y0
-        b = self.ncols if y1 is None else y1
-
         key = (y0, x0, y1, x1)
-        overlap = key in self.objects
-        clone = self.clone(mode='override')
-        if not overlap:
-            clone.objects[key] = Pane(obj)
-            grid = clone.grid
-        else:
+        hits = self._intersecting(0 if y0 is None else y0, y1,
+                                  0 if x0 is None else x0, x1)
+        if hits:
+            objects = _ordered_dict(self.objects)
+            overlap = key in objects
+            if not overlap:
+                objects[key] = Pane(obj)
+            clone = self.clone(mode='override', objects=objects)
             grid = clone.grid
-            grid[t:b, l:r] += 1
-
-        overlap_grid = grid>1
-        if (overlap_grid).any():
-            overlapping = ''
-            objects = []
-            for (yidx, xidx) in zip(*np.where(overlap_grid)):
-                old_obj = self[yidx, xidx]
-                if old_obj not in objects:
-                    objects.append(old_obj)
-                    overlapping += '    (%d, %d): %s\n\n' % (yidx, xidx, old_obj)
+            if overlap:
+                l = 0 if x0 is None else x0
+                r = clone.ncols if x1 is None else x1
+                t = 0 if y0 is None else y0
+                b = clone.nrows if y1 is None else y1
+                grid[t:b, l:r] += 1
+
+            overlapping = ''.join('    (%d, %d): %s\n\n' % (y, x, old_obj)
+                                  for (y, x), _, old_obj in hits)
             overlap_text = ('Specified region overlaps with the following '
                             'existing object(s) in the grid:\n\n'+overlapping+
                             'The following shows a view of the grid '
@@ -882,7 +1029,8 @@ class GridSpec(Panel):
                 raise IndexError(overlap_text)
             elif self.mode == 'warn':
                 self.param.warning(overlap_text)
-            self.__delitem__(index, False)
+            for _, old_key, _ in hits:
+                del self.objects[old_key]
         self.objects[key] = Pane(obj)
         self.param.trigger('objects')
 
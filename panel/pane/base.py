@@ -216,7 +216,11 @@ class PaneBase(Reactive):
             return type(obj)
         descendents = []
         for p in param.concrete_descendents(PaneBase).values():
-            priority = p.applies(obj) if p.priority is None else p.priority
+            if p.priority is None:
+                # A priority returned by applies implies the Pane applies
+                priority = applies = p.applies(obj)
+            else:
+                priority, applies = p.priority, None
             if isinstance(priority, bool) and priority:
                 raise ValueError('If a Pane declares no priority '
                                  'the applies method should return a '
@@ -225,10 +229,11 @@ class PaneBase(Reactive):
                                  'declares no priority.' % p.__name__)
             elif priority is None or priority is False:
                 continue
-            descendents.append((priority, p))
+            descendents.append((priority, applies, p))
         pane_types = reversed(sorted(descendents, key=lambda x: x[0]))
-        for _, pane_type in pane_types:
-            applies = pane_type.applies(obj)
+        for _, applies, pane_type in pane_types:
+            if applies is None:
+                applies = pane_type.applies(obj)
             if isinstance(applies, bool) and not applies: continue
             return pane_type
         raise TypeError('%s type could not be rendered.' % type(obj).__name__)
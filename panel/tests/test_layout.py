@@ -45,6 +45,33 @@ def test_layout_model_cache_cleanup(layout, document, comm):
     assert l._models == {}
 
 
+def test_nested_layout_model_cache_cleanup(document, comm):
+    inner = Column(Div())
+    outer = Row(Column(inner))
+    pane = inner[0]
+
+    model = outer.get_root(document, comm)
+
+    assert model.ref['id'] in pane._models
+    outer._cleanup(model)
+    assert outer._models == {}
+    assert inner._models == {}
+    assert pane._models == {}
+
+
+def test_gridspec_model_cache_cleanup(document, comm):
+    gspec = GridSpec()
+    gspec[0, 0] = Div()
+    pane = gspec[0, 0]
+
+    model = gspec.get_root(document, comm)
+
+    assert model.ref['id'] in pane._models
+    gspec._cleanup(model)
+    assert gspec._models == {}
+    assert pane._models == {}
+
+
 @pytest.mark.parametrize('panel', [Column, Row])
 def test_layout_constructor(panel):
     div1 = Div()
@@ -178,6 +205,24 @@ def test_layout_setitem(panel, document, comm):
     assert p1._models == {}
 
 
+@pytest.mark.parametrize('panel', [Column, Row])
+def test_layout_set_identical_objects(panel, document, comm, monkeypatch):
+    div1 = Div()
+    div2 = Div()
+    layout = panel(div1, div2)
+
+    model = layout.get_root(document, comm=comm)
+    children = list(model.children)
+
+    def _get_objects(*args, **kwargs):
+        raise AssertionError('Child models should not be recreated')
+    monkeypatch.setattr(panel, '_get_objects', _get_objects)
+
+    layout.objects = list(layout.objects)
+    assert len(model.children) == len(children)
+    assert all(a is b for a, b in zip(model.children, children))
+
+
 @pytest.mark.parametrize('panel', [Column, Row])
 def test_layout_setitem_out_of_bounds(panel, document, comm):
     div1 = Div()
@@ -239,6 +284,24 @@ def test_layout_setitem_replace_slice(panel, document, comm):
     assert p3._models == {}
 
 
+@pytest.mark.parametrize('panel', [Column, Row])
+def test_layout_setitem_replace_negative_slice(panel, document, comm):
+    div1 = Div()
+    div2 = Div()
+    div3 = Div()
+    layout = panel(div1, div2, div3)
+    p1, p2, p3 = layout.objects
+
+    model = layout.get_root(document, comm=comm)
+
+    div4 = Div()
+    div5 = Div()
+    layout[-2:] = [div4, div5]
+    assert model.children == [div1, div4, div5]
+    assert p2._models == {}
+    assert p3._models == {}
+
+
 @pytest.mark.parametrize('panel', [Column, Row])
 def test_layout_setitem_replace_slice_error(panel, document, comm):
     div1 = Div()
@@ -295,6 +358,48 @@ def test_layout_remove(panel, document, comm):
     assert p1._models == {}
 
 
+@pytest.mark.parametrize('panel', [Column, Row])
+def test_layout_contains(panel):
+    div1 = Div()
+    div2 = Div()
+    layout = panel(div1)
+    p1 = layout[0]
+
+    assert p1 in layout
+    layout.append(div2)
+    p2 = layout[1]
+    assert p2 in layout
+    layout.remove(p1)
+    assert p1 not in layout
+    assert p2 in layout
+
+
+@pytest.mark.parametrize('panel', [Column, Row])
+def test_layout_contains_modified_in_place(panel):
+    layout = panel(Div())
+    p1 = layout[0]
+    assert p1 in layout
+
+    p2 = Pane(Div())
+    layout.objects.append(p2)
+    assert p2 in layout
+    layout.remove(p2)
+    assert p2 not in layout
+
+    p3 = Pane(Div())
+    layout.objects[0] = p3
+    assert p1 not in layout
+    assert p3 in layout
+
+
+@pytest.mark.parametrize('panel', [Column, Row])
+def test_layout_remove_missing(panel):
+    layout = panel(Div())
+
+    with pytest.raises(ValueError):
+        layout.remove(Div())
+
+
 @pytest.mark.parametrize('panel', [Column, Row])
 def test_layout_clear(panel, document, comm):
     div1 = Div()
@@ -668,6 +773,21 @@ def test_tabs_setitem(document, comm):
     assert p1._models == {}
 
 
+def test_tabs_setitem_rename(document, comm):
+    div1 = Div()
+    div2 = Div()
+    tabs = Tabs(('A', div1), ('B', div2))
+    p1, p2 = tabs.objects
+
+    model = tabs.get_root(document, comm=comm)
+
+    tabs[0] = ('New', p1)
+    tab1, tab2 = model.tabs
+    assert tab1.child is div1
+    assert tab1.title == 'New'
+    assert tab2.title == 'B'
+
+
 def test_tabs_clone():
     div1 = Div()
     div2 = Div()
@@ -902,6 +1022,81 @@ def test_gridspec_slice_setitem():
     assert list(gspec.objects) == [(0, None, 1, None)]
 
 
+def test_gridspec_integer_getitem():
+    div1 = Div()
+    div2 = Div()
+    gspec = GridSpec()
+    gspec[0, 0] = div1
+    gspec[0, 1:3] = div2
+
+    assert gspec[0, 0].object is div1
+    assert gspec[0, 2].object is div2
+    with pytest.raises(IndexError):
+        gspec[1, 0]
+
+
+def test_gridspec_slice_getitem():
+    div1 = Div()
+    div2 = Div()
+    div3 = Div()
+    gspec = GridSpec(width=800, height=600)
+    gspec[0, 0] = div1
+    gspec[0, 1:3] = div2
+    gspec[1, :] = div3
+
+    subgrid = gspec[:, 1:]
+    assert list(subgrid.objects) == [(0, 1, 1, 3), (1, None, 2, None)]
+    assert subgrid.objects[(0, 1, 1, 3)].object is div2
+    assert subgrid.objects[(1, None, 2, None)].object is div3
+
+
+def test_gridspec_getitem_out_of_bounds():
+    gspec = GridSpec()
+    with pytest.raises(IndexError):
+        gspec[0]
+
+    gspec[0, 0:2] = Div()
+    with pytest.raises(IndexError):
+        gspec[10]
+    with pytest.raises(IndexError):
+        gspec[:, 10]
+
+
+def test_gridspec_getitem_slice_step():
+    gspec = GridSpec()
+    gspec[0, 0] = Div()
+    gspec[1, 0] = Div()
+    with pytest.raises(IndexError):
+        gspec[::2]
+
+
+def test_gridspec_grid():
+    gspec = GridSpec()
+    gspec[0, 0] = Div()
+    gspec[0, 1:3] = Div()
+    gspec[1, :] = Div()
+
+    assert gspec.grid.tolist() == [[1, 1, 1], [1, 1, 1]]
+
+
+def test_gridspec_grid_open_slice_past_bounds():
+    gspec = GridSpec()
+    gspec[0, 1:] = Div()
+
+    assert gspec.grid.shape == (1, 0)
+
+
+def test_gridspec_setitem_open_slice_override():
+    div1 = Div()
+    div2 = Div()
+    gspec = GridSpec(mode='override')
+    gspec[0, 1:] = div1
+    gspec[0, :] = div2
+
+    assert list(gspec.objects) == [(0, None, 1, None)]
+    assert gspec.objects[(0, None, 1, None)].object is div2
+
+
 def test_gridspec_setitem_int_overlap():
     div = Div()
     gspec = GridSpec(mode='error')
@@ -918,6 +1113,14 @@ def test_gridspec_setitem_slice_overlap():
         gspec[0, 1] = div
 
 
+def test_gridspec_setitem_empty_region_no_overlap():
+    div = Div()
+    gspec = GridSpec(mode='error')
+    gspec[0, 0:3] = div
+    gspec[0, 2:2] = Div()
+    assert gspec.objects[(0, 0, 1, 3)].object is div
+
+
 def test_gridspec_setitem_cell_override():
     div = Div()
     div2 = Div()
@@ -954,6 +1157,41 @@ def test_gridspec_fixed_with_int_setitem(document, comm):
     assert div2.height == 250
 
 
+def test_gridspec_fixed_setitem_after_render(document, comm):
+    div1 = Div()
+    div2 = Div()
+    gspec = GridSpec(width=800, height=500)
+
+    gspec[0, 0] = div1
+    model = gspec.get_root(document, comm=comm)
+    assert div1.width == 800
+    assert div1.height == 500
+
+    gspec[1, 1] = div2
+    assert model.children == [(div1, 0, 0, 1, 1), (div2, 1, 1, 1, 1)]
+    assert div1.width == 400
+    assert div1.height == 250
+    assert div2.width == 400
+    assert div2.height == 250
+
+
+def test_gridspec_fixed_delitem_after_render(document, comm):
+    div1 = Div()
+    div2 = Div()
+    gspec = GridSpec(width=800, height=500)
+
+    gspec[0, 0] = div1
+    gspec[1, 1] = div2
+    model = gspec.get_root(document, comm=comm)
+    assert div1.width == 400
+    assert div1.height == 250
+
+    del gspec[1, 1]
+    assert model.children == [(div1, 0, 0, 1, 1)]
+    assert div1.width == 800
+    assert div1.height == 500
+
+
 def test_gridspec_fixed_with_slice_setitem(document, comm):
     div1 = Div()
     div2 = Div()